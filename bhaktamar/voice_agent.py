@@ -4,25 +4,18 @@ Bhaktambar Voice Agent — Pipecat pipeline with NVIDIA Riva STT/TTS and Kimi K2
 Pipeline: DailyTransport → Riva STT (Parakeet) → Kimi K2.5 LLM → Riva TTS (Magpie) → DailyTransport
 """
 
-import asyncio
-import os
+from multiprocessing.synchronize import Event
 
 from dotenv import load_dotenv
-from loguru import logger
-
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.frames.frames import LLMMessagesAppendFrame, LLMRunFrame
-from pipecat.pipeline.pipeline import Pipeline
-from pipecat.pipeline.runner import PipelineRunner
-from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.services.nvidia.llm import NvidiaLLMService
-from pipecat.services.nvidia.stt import NvidiaSTTService
-from pipecat.services.nvidia.tts import NvidiaTTSService
-from pipecat.services.openai.llm import OpenAILLMContext
-from pipecat.transports.daily.transport import DailyParams, DailyTransport
+
+from common.bot_runner import run_in_worker
+from common.config import Config
+from common.voice_pipeline import VoiceBot, run_voice_bot
 
 load_dotenv()
 
+CONFIG = Config.from_env(llm_model="moonshotai/kimi-k2.5")
+
 # ---------------------------------------------------------------------------
 # Bhaktambar system prompt — full knowledge base
 # ---------------------------------------------------------------------------
@@ -114,129 +107,33 @@ CRITICAL VOICE FORMATTING RULES:
 - Instead of lists, weave information naturally into flowing sentences.
 """
 
+# Fixed opening line. The TTS precaches its audio so joining users hear it
+# without waiting on the LLM or a Riva round-trip.
+WELCOME_MESSAGE = "Namaste and welcome! I am your guide to the Bhaktambar Stotra, the beautiful 48-verse Jain hymn of devotion composed by Acharya Manatunga. You can ask me about any verse, its meaning, or the spiritual wisdom within. What would you like to explore today?"
+
 
 # ---------------------------------------------------------------------------
 # Main bot entry point
 # ---------------------------------------------------------------------------
 
+BHAKTAMBAR_BOT = VoiceBot(
+    name="Bhaktambar",
+    config=CONFIG,
+    participant_name="Bhaktambar Guide",
+    system_prompt=SYSTEM_PROMPT,
+    welcome_message=WELCOME_MESSAGE,
+)
+
+
 async def run_bot(room_url: str, token: str):
     """Run the Bhaktambar voice agent bot in a Daily.co room."""
-    logger.info(f"Starting Bhaktambar bot in room: {room_url}")
-
-    nvidia_api_key = os.getenv("NVIDIA_API_KEY")
-    if not nvidia_api_key:
-        raise RuntimeError("NVIDIA_API_KEY not set")
-
-    # ---- Daily.co transport ------------------------------------------------
-    transport = DailyTransport(
-        room_url,
-        token,
-        "Bhaktambar Guide",
-        DailyParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(),
-            transcription_enabled=False,
-        ),
-    )
-
-    # ---- NVIDIA Riva STT (Parakeet RNNT) -----------------------------------
-    stt = NvidiaSTTService(
-        api_key=nvidia_api_key,
-        server=os.getenv("RIVA_ASR_URL", "grpc.nvcf.nvidia.com:443"),
-        model_function_map={
-            "function_id": os.getenv("RIVA_ASR_FUNCTION_ID", "1598d209-5e27-4d3c-8079-4751568b1081"),
-            "model_name": "parakeet-ctc-1.1b-asr",
-        },
-        sample_rate=int(os.getenv("RIVA_ASR_SAMPLE_RATE", "16000")),
-    )
-    logger.info("Riva STT ready (Parakeet)")
-
-    # ---- Kimi K2.5 LLM (via NVIDIA Integrate API) --------------------------
-    llm = NvidiaLLMService(
-        api_key=nvidia_api_key,
-        base_url=os.getenv("NVIDIA_LLM_BASE_URL", "https://integrate.api.nvidia.com/v1"),
-        model=os.getenv("NVIDIA_LLM_MODEL", "moonshotai/kimi-k2.5"),
-    )
-    logger.info(f"Kimi K2.5 LLM ready")
-
-    # ---- NVIDIA Riva TTS (Magpie Multilingual) -----------------------------
-    tts = NvidiaTTSService(
-        api_key=nvidia_api_key,
-        server=os.getenv("RIVA_TTS_URL", "grpc.nvcf.nvidia.com:443"),
-        voice_id=os.getenv("RIVA_TTS_VOICE_ID", "Magpie-Multilingual.EN-US.Sofia"),
-        model_function_map={
-            "function_id": os.getenv("RIVA_TTS_FUNCTION_ID", "877104f7-e885-42b9-8de8-f6e4c6303969"),
-            "model_name": "magpie-tts-multilingual",
-        },
-        sample_rate=int(os.getenv("TTS_SAMPLE_RATE", "16000")),
-    )
-    logger.info("Riva TTS ready (Magpie)")
-
-    # ---- LLM context -------------------------------------------------------
-    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-    context = OpenAILLMContext(messages)
-    context_aggregator = llm.create_context_aggregator(context)
-
-    # ---- Pipeline -----------------------------------------------------------
-    pipeline = Pipeline([
-        transport.input(),
-        stt,
-        context_aggregator.user(),
-        llm,
-        tts,
-        transport.output(),
-        context_aggregator.assistant(),
-    ])
-
-    task = PipelineTask(
-        pipeline,
-        params=PipelineParams(
-            allow_interruptions=True,
-            enable_metrics=True,
-            enable_usage_metrics=True,
-        ),
-    )
-
-    # ---- Event handlers -----------------------------------------------------
-    greeted = {"value": False}
-
-    @transport.event_handler("on_first_participant_joined")
-    async def on_first_participant_joined(transport, participant):
-        logger.info(f"Participant joined: {participant.get('id')}")
-        await task.queue_frames([
-            LLMMessagesAppendFrame([{
-                "role": "user",
-                "content": "The user has just joined the session. Immediately greet them with a warm welcome. Say exactly in plain speech without any formatting: Namaste and welcome! I am your guide to the Bhaktambar Stotra, the beautiful 48-verse Jain hymn of devotion composed by Acharya Manatunga. You can ask me about any verse, its meaning, or the spiritual wisdom within. What would you like to explore today?",
-            }]),
-            LLMRunFrame(),
-        ])
-        greeted["value"] = True
-
-    @transport.event_handler("on_participant_left")
-    async def on_participant_left(transport, participant, reason):
-        logger.info(f"Participant left: {participant.get('id')}, reason: {reason}")
-        await task.cancel()
-
-    # Auto-greet fallback
-    async def _autogreet():
-        try:
-            await asyncio.sleep(3.0)
-            if not greeted["value"]:
-                await task.queue_frames([
-                    LLMMessagesAppendFrame([{
-                        "role": "user",
-                        "content": "Please greet me and tell me briefly what you can help with regarding Bhaktambar Stotra.",
-                    }]),
-                    LLMRunFrame(),
-                ])
-                logger.info("Auto-greeting enqueued")
-        except Exception:
-            logger.debug("autogreet failed")
-
-    asyncio.create_task(_autogreet())
-
-    # ---- Run ----------------------------------------------------------------
-    runner = PipelineRunner()
-    await runner.run(task)
-    logger.info("Bot pipeline finished")
+    await run_voice_bot(BHAKTAMBAR_BOT, room_url, token)
+
+
+# ---------------------------------------------------------------------------
+# Bot process entry point
+# ---------------------------------------------------------------------------
+
+def bot_entry(room_url: str, token: str, stop_event: Event):
+    """Bot process entry point; see :func:`common.bot_runner.run_in_worker`."""
+    run_in_worker(run_bot, room_url, token, stop_event)
@@ -4,188 +4,193 @@ AIQNEX Voice Agent — Pipecat pipeline with NVIDIA Riva STT/TTS and NVIDIA LLM.
 Pipeline: DailyTransport → Riva STT (Parakeet) → NVIDIA LLM → Riva TTS (Magpie) → DailyTransport
 """
 
-import asyncio
-import os
+from multiprocessing.synchronize import Event
 
 from dotenv import load_dotenv
-from loguru import logger
-
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.frames.frames import LLMMessagesAppendFrame, LLMRunFrame
-from pipecat.pipeline.pipeline import Pipeline
-from pipecat.pipeline.runner import PipelineRunner
-from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.services.nvidia.llm import NvidiaLLMService
-from pipecat.services.nvidia.stt import NvidiaSTTService
-from pipecat.services.nvidia.tts import NvidiaTTSService
-from pipecat.services.openai.llm import OpenAILLMContext
-from pipecat.transports.daily.transport import DailyParams, DailyTransport
+
+from pipecat.adapters.schemas.function_schema import FunctionSchema
+from pipecat.adapters.schemas.tools_schema import ToolsSchema
+from pipecat.services.llm_service import FunctionCallParams
+
+from common.bot_runner import run_in_worker
+from common.config import Config
+from common.voice_pipeline import VoiceBot, run_voice_bot
 
 load_dotenv()
 
+CONFIG = Config.from_env(llm_model="meta/llama-3.1-8b-instruct")
+
 # ---------------------------------------------------------------------------
 # AIQNEX system prompt
 # ---------------------------------------------------------------------------
 SYSTEM_PROMPT = """You are the AIQNEX Voice Assistant — a friendly, professional AI representative for AIQNEX (aiqnex.com), an AI & Quantum Computing training institution based in Singapore.
 
-ABOUT AIQNEX:
-AIQNEX is a premier training institution specializing in Artificial Intelligence and Quantum Computing education. We empower professionals, businesses, and curious learners with cutting-edge skills for the future.
-
-PROGRAMS OFFERED:
-1. AI Engineering Bootcamp — Intensive weekend program covering machine learning, deep learning, and AI application development.
-2. Business Leadership Workshops — Helping leaders understand and leverage AI strategy for competitive advantage.
-3. Self-Paced Modules — Flexible online courses for independent learners covering AI and Quantum Computing fundamentals.
-4. Community Webinars — Free monthly sessions on trending AI and Quantum topics.
-5. Career Readiness Program — Interview prep, portfolio building, and job placement support for AI careers.
-6. Corporate Training — Customized AI and Quantum Computing training for enterprise teams.
-
-UPCOMING COURSES:
-- "Mastering Agentic AI" — Feb 28 - Mar 1, 2025 (Weekend). Price: SGD $800. Covers autonomous AI agents, tool use, multi-agent systems, and practical deployment.
-- "Quantum Computing Fundamentals" — Feb 7-8, 2025 (Weekend). Price: SGD $800. Covers qubits, quantum gates, circuits, algorithms (Grover's, Shor's), and hands-on with Qiskit.
-
-LEADERSHIP TEAM:
-- Vinod Martin — Co-Founder. 30+ years in IT industry, passionate about democratizing AI and Quantum education.
-- Shreya Dasaur Chadha — Training Program Manager. Expert in curriculum design and learning experience.
-- Shashank — Technology Advisor. Guides the technical direction of AIQNEX programs.
-
-CONTACT INFORMATION:
-- Email: contact@aiqnex.com
-- Phone: +65 8974 9095
-- Address: 10 Ubi Crescent, #04-33 Ubi Techpark, Singapore 408564
-- Website: aiqnex.com
-
-CONVERSATION GUIDELINES:
+GUIDELINES:
+- For programs, upcoming courses (dates, prices), the team or contact details, call get_aiqnex_info first. Never guess these facts.
+- Keep responses concise (2-3 sentences) in natural spoken language, since this is a voice conversation.
 - Be warm, enthusiastic, and professional.
-- Keep responses concise (2-3 sentences) since this is a voice conversation.
-- NEVER say the company name out loud. Instead refer to it as "we", "us", "our institute", or "our training programs". For example say "Welcome to our AI and Quantum Computing training institute!" instead of mentioning the name.
-- If asked about topics outside our scope, politely redirect to what we offer.
-- Encourage users to visit our website or contact us for more details.
-- Use natural, conversational language appropriate for spoken dialogue.
+- NEVER say the company name out loud. Refer to it as "we", "us", "our institute", or "our training programs".
+- If asked about topics outside our scope, politely redirect to what we offer, and encourage users to visit our website or contact us.
 """
 
+# The one copy of the institute's facts. The get_aiqnex_info results and the
+# spoken FAQ answers below are both built from these tables.
+_PROGRAMS = (
+    # (name, description)
+    ("AI Engineering Bootcamp", "Intensive weekend program covering machine learning, deep learning, and AI application development."),
+    ("Business Leadership Workshops", "Helping leaders understand and leverage AI strategy for competitive advantage."),
+    ("Self-Paced Modules", "Flexible online courses for independent learners covering AI and Quantum Computing fundamentals."),
+    ("Community Webinars", "Free monthly sessions on trending AI and Quantum topics."),
+    ("Career Readiness Program", "Interview prep, portfolio building, and job placement support for AI careers."),
+    ("Corporate Training", "Customized AI and Quantum Computing training for enterprise teams."),
+)
+_COURSES = (
+    # (title, weekend dates, price in SGD, topics covered)
+    ("Quantum Computing Fundamentals", "February 7 to 8, 2025", 800, "qubits, quantum gates, circuits, algorithms (Grover's, Shor's), and hands-on with Qiskit"),
+    ("Mastering Agentic AI", "February 28 to March 1, 2025", 800, "autonomous AI agents, tool use, multi-agent systems, and practical deployment"),
+)
+_TEAM = (
+    # (name, role, background)
+    ("Vinod Martin", "Co-Founder", "30+ years in IT industry, passionate about democratizing AI and Quantum education."),
+    ("Shreya Dasaur Chadha", "Training Program Manager", "Expert in curriculum design and learning experience."),
+    ("Shashank", "Technology Advisor", "Guides the technical direction of AIQNEX programs."),
+)
+_EMAIL = "contact@aiqnex.com"
+_PHONE = "+65 8974 9095"
+_STREET, _UNIT, _BUILDING, _POSTCODE = "10 Ubi Crescent", "04-33", "Ubi Techpark", "Singapore 408564"
+_WEBSITE = "aiqnex.com"
+
+
+def _spoken_list(items: list[str]) -> str:
+    return items[0] if len(items) == 1 else f"{', '.join(items[:-1])} and {items[-1]}"
+
+
+# Details the LLM fetches on demand via get_aiqnex_info, so they stay out of
+# the system prompt that is prefilled on every turn.
+AIQNEX_INFO = {
+    "programs": "PROGRAMS OFFERED:\n" + "\n".join(
+        f"{i}. {name} — {description}" for i, (name, description) in enumerate(_PROGRAMS, 1)
+    ),
+    "courses": "UPCOMING COURSES:\n" + "\n".join(
+        f'- "{title}" — {dates} (Weekend). Price: SGD ${price}. Covers {topics}.'
+        for title, dates, price, topics in _COURSES
+    ),
+    "team": "LEADERSHIP TEAM:\n" + "\n".join(
+        f"- {name} — {role}. {background}" for name, role, background in _TEAM
+    ),
+    "contact": f"""CONTACT INFORMATION:
+- Email: {_EMAIL}
+- Phone: {_PHONE}
+- Address: {_STREET}, #{_UNIT} {_BUILDING}, {_POSTCODE}
+- Website: {_WEBSITE}""",
+}
+
+AIQNEX_TOOLS = ToolsSchema(standard_tools=[
+    FunctionSchema(
+        name="get_aiqnex_info",
+        description="Look up details about our institute: programs offered, upcoming courses with dates and prices, the leadership team, or contact information.",
+        properties={
+            "topic": {"type": "string", "enum": list(AIQNEX_INFO)},
+        },
+        required=["topic"],
+    ),
+])
+
+
+async def get_aiqnex_info(params: FunctionCallParams):
+    """Tool handler: return the requested block of AIQNEX details."""
+    topic = params.arguments.get("topic")
+    await params.result_callback(
+        AIQNEX_INFO.get(topic, f"Unknown topic. Choose one of: {', '.join(AIQNEX_INFO)}.")
+    )
+
+
+# Common questions answered straight from these fixed, caller-independent
+# answers (see common/faq_cache.py). Several phrasings per answer help the
+# semantic match; questions that could be confused share one answer.
+AIQNEX_FAQS = (
+    (
+        (
+            "What programs do you offer?",
+            "What kind of training do you provide?",
+            "What courses and programs do you have?",
+        ),
+        f"We offer {_spoken_list([name for name, _ in _PROGRAMS])}. Which one would you like to hear more about?",
+    ),
+    (
+        (
+            "What courses are coming up?",
+            "When is your next course?",
+            "How much do your courses cost?",
+            "How much is the quantum computing course?",
+            "Quantum course price?",
+            "How much is the agentic AI course?",
+            "When does the quantum computing course start?",
+            "When does the agentic AI course start?",
+        ),
+        "Our upcoming weekend courses: " + " ".join(
+            f"{title} runs {dates}, and costs {price} Singapore dollars."
+            for title, dates, price, _ in _COURSES
+        ),
+    ),
+    (
+        (
+            "How can I contact you?",
+            "What is your phone number?",
+            "What is your email address?",
+            "How do I get in touch with you?",
+        ),
+        f"You can email us at {_EMAIL}, or call us on {_PHONE.replace('+', 'plus ')}.",
+    ),
+    (
+        (
+            "Where are you located?",
+            "What is your address?",
+            "Where is your office?",
+        ),
+        f"We are at {_STREET}, unit {_UNIT}, {_BUILDING}, {_POSTCODE}.",
+    ),
+    (
+        (
+            "Who runs your institute?",
+            "Who is on your leadership team?",
+            "Who are the founders?",
+        ),
+        " ".join(f"{name} is our {role.lower()}." for name, role, _ in _TEAM),
+    ),
+)
+
+
+# Fixed opening line. The TTS precaches its audio so joining users hear it
+# without waiting on the LLM or a Riva round-trip.
+WELCOME_MESSAGE = "Welcome! I'm your AI assistant for our AI and Quantum Computing training institute in Singapore. I can help you with our programs, courses, pricing and more. How can I help you today?"
+
 
 # ---------------------------------------------------------------------------
 # Main bot entry point
 # ---------------------------------------------------------------------------
 
+AIQNEX_BOT = VoiceBot(
+    name="AIQNEX",
+    config=CONFIG,
+    participant_name="AIQNEX Assistant",
+    system_prompt=SYSTEM_PROMPT,
+    welcome_message=WELCOME_MESSAGE,
+    tools=AIQNEX_TOOLS,
+    functions={"get_aiqnex_info": get_aiqnex_info},
+    faqs=AIQNEX_FAQS,
+)
+
+
 async def run_bot(room_url: str, token: str):
     """Run the AIQNEX voice agent bot in a Daily.co room."""
-    logger.info(f"Starting AIQNEX bot in room: {room_url}")
-
-    nvidia_api_key = os.getenv("NVIDIA_API_KEY")
-    if not nvidia_api_key:
-        raise RuntimeError("NVIDIA_API_KEY not set")
-
-    # ---- Daily.co transport ------------------------------------------------
-    transport = DailyTransport(
-        room_url,
-        token,
-        "AIQNEX Assistant",
-        DailyParams(
-            audio_in_enabled=True,
-            audio_out_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(),
-            transcription_enabled=False,
-        ),
-    )
+    await run_voice_bot(AIQNEX_BOT, room_url, token)
 
-    # ---- NVIDIA Riva STT (Parakeet RNNT) -----------------------------------
-    stt = NvidiaSTTService(
-        api_key=nvidia_api_key,
-        server=os.getenv("RIVA_ASR_URL", "grpc.nvcf.nvidia.com:443"),
-        model_function_map={
-            "function_id": os.getenv("RIVA_ASR_FUNCTION_ID", "1598d209-5e27-4d3c-8079-4751568b1081"),
-            "model_name": "parakeet-ctc-1.1b-asr",
-        },
-        sample_rate=int(os.getenv("RIVA_ASR_SAMPLE_RATE", "16000")),
-    )
-    logger.info("Riva STT ready (Parakeet)")
 
-    # ---- NVIDIA LLM --------------------------------------------------------
-    llm = NvidiaLLMService(
-        api_key=nvidia_api_key,
-        base_url=os.getenv("NVIDIA_LLM_BASE_URL", "https://integrate.api.nvidia.com/v1"),
-        model=os.getenv("NVIDIA_LLM_MODEL", "meta/llama-3.1-8b-instruct"),
-    )
-    logger.info(f"NVIDIA LLM ready ({os.getenv('NVIDIA_LLM_MODEL', 'meta/llama-3.1-8b-instruct')})")
-
-    # ---- NVIDIA Riva TTS (Magpie Multilingual) -----------------------------
-    tts = NvidiaTTSService(
-        api_key=nvidia_api_key,
-        server=os.getenv("RIVA_TTS_URL", "grpc.nvcf.nvidia.com:443"),
-        voice_id=os.getenv("RIVA_TTS_VOICE_ID", "Magpie-Multilingual.EN-US.Sofia"),
-        model_function_map={
-            "function_id": os.getenv("RIVA_TTS_FUNCTION_ID", "877104f7-e885-42b9-8de8-f6e4c6303969"),
-            "model_name": "magpie-tts-multilingual",
-        },
-        sample_rate=int(os.getenv("TTS_SAMPLE_RATE", "16000")),
-    )
-    logger.info("Riva TTS ready (Magpie)")
-
-    # ---- LLM context -------------------------------------------------------
-    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-    context = OpenAILLMContext(messages)
-    context_aggregator = llm.create_context_aggregator(context)
-
-    # ---- Pipeline -----------------------------------------------------------
-    pipeline = Pipeline([
-        transport.input(),
-        stt,
-        context_aggregator.user(),
-        llm,
-        tts,
-        transport.output(),
-        context_aggregator.assistant(),
-    ])
-
-    task = PipelineTask(
-        pipeline,
-        params=PipelineParams(
-            allow_interruptions=True,
-            enable_metrics=True,
-            enable_usage_metrics=True,
-        ),
-    )
+# ---------------------------------------------------------------------------
+# Bot process entry point
+# ---------------------------------------------------------------------------
 
-    # ---- Event handlers -----------------------------------------------------
-    greeted = {"value": False}
-
-    @transport.event_handler("on_first_participant_joined")
-    async def on_first_participant_joined(transport, participant):
-        logger.info(f"Participant joined: {participant.get('id')}")
-        await task.queue_frames([
-            LLMMessagesAppendFrame([{
-                "role": "user",
-                "content": "The user has just joined. Greet them warmly. Say: Welcome! I'm your AI assistant for our AI and Quantum Computing training institute in Singapore. I can help you with our programs, courses, pricing and more. How can I help you today?",
-            }]),
-            LLMRunFrame(),
-        ])
-        greeted["value"] = True
-
-    @transport.event_handler("on_participant_left")
-    async def on_participant_left(transport, participant, reason):
-        logger.info(f"Participant left: {participant.get('id')}, reason: {reason}")
-        await task.cancel()
-
-    # Auto-greet fallback
-    async def _autogreet():
-        try:
-            await asyncio.sleep(3.0)
-            if not greeted["value"]:
-                await task.queue_frames([
-                    LLMMessagesAppendFrame([{
-                        "role": "user",
-                        "content": "Please greet me warmly and tell me briefly what you can help with. Do not say any company name.",
-                    }]),
-                    LLMRunFrame(),
-                ])
-                logger.info("Auto-greeting enqueued")
-        except Exception:
-            logger.debug("autogreet failed")
-
-    asyncio.create_task(_autogreet())
-
-    # ---- Run ----------------------------------------------------------------
-    runner = PipelineRunner()
-    await runner.run(task)
-    logger.info("Bot pipeline finished")
+def bot_entry(room_url: str, token: str, stop_event: Event):
+    """Bot process entry point; see :func:`common.bot_runner.run_in_worker`."""
+    run_in_worker(run_bot, room_url, token, stop_event)
@@ -0,0 +1 @@
+"""Code shared by the AIQNEX and Bhaktambar voice-bot services."""
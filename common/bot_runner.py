@@ -0,0 +1,105 @@
+"""Per-room plumbing shared by the voice agents: the welcome greeting and the bot process entry point."""
+
+import asyncio
+from multiprocessing.synchronize import Event
+from typing import Awaitable, Callable
+
+from loguru import logger
+
+from pipecat.frames.frames import LLMMessagesAppendFrame, TTSSpeakFrame
+from pipecat.pipeline.task import PipelineTask
+from pipecat.transports.daily.transport import DailyTransport
+
+try:
+    # Noticeably cheaper scheduling for the per-frame awaits in the pipeline.
+    from uvloop import run as _run_event_loop
+except ImportError:  # no uvloop build for Windows
+    from asyncio import run as _run_event_loop
+
+# How long to wait for the join event before greeting anyway.
+AUTOGREET_SECS = 3.0
+
+
+def welcome_frames(message: str) -> list:
+    """Speak ``message`` and record it in the context (TTSSpeakFrame alone isn't)."""
+    return [
+        LLMMessagesAppendFrame([{"role": "assistant", "content": message}], run_llm=False),
+        TTSSpeakFrame(message),
+    ]
+
+
+def _log_autogreet_error(t: asyncio.Task):
+    """Done-callback: report an unexpected auto-greet failure right away."""
+    if not t.cancelled() and t.exception() is not None:
+        logger.opt(exception=t.exception()).error("Auto-greeting failed")
+
+
+def greet_first_participant(transport: DailyTransport, task: PipelineTask, message: str) -> asyncio.Task:
+    """Speak ``message`` once, when the first participant joins.
+
+    If no join event has arrived after :data:`AUTOGREET_SECS` but someone is
+    already in the room, greet them anyway. If the room is still empty, the
+    join handler greets whoever arrives later. Returns the fallback task;
+    cancel it when the room ends.
+    """
+    greeted = asyncio.Event()
+
+    @transport.event_handler("on_first_participant_joined")
+    async def on_first_participant_joined(transport, participant):
+        logger.opt(lazy=True).info("Participant joined: {}", lambda: participant.get("id"))
+        autogreet_task.cancel()
+        # Set before awaiting so a late auto-greet can't also speak.
+        if not greeted.is_set():
+            greeted.set()
+            await task.queue_frames(welcome_frames(message))
+
+    async def _autogreet():
+        try:
+            await asyncio.wait_for(greeted.wait(), timeout=AUTOGREET_SECS)
+        except asyncio.TimeoutError:
+            # A slow browser or mic prompt can keep the user out for longer;
+            # don't speak into an empty room and then stay silent on join.
+            if not any(pid != "local" for pid in transport.participants()):
+                return
+            greeted.set()
+            try:
+                await task.queue_frames(welcome_frames(message))
+                logger.info("Auto-greeting enqueued")
+            except RuntimeError as e:
+                # The pipeline is already shutting down; nobody is left to greet.
+                logger.debug(f"autogreet skipped: {e}")
+
+    autogreet_task = asyncio.create_task(_autogreet())
+    autogreet_task.add_done_callback(_log_autogreet_error)
+    return autogreet_task
+
+
+async def _run_until_stopped(
+    run_bot: Callable[[str, str], Awaitable[None]],
+    room_url: str,
+    token: str,
+    stop_event: Event,
+):
+    bot = asyncio.create_task(run_bot(room_url, token))
+    while not bot.done():
+        if await asyncio.to_thread(stop_event.wait, 1.0):
+            bot.cancel()
+            break
+    try:
+        await bot
+    except asyncio.CancelledError:
+        logger.info("Bot stopped by server")
+
+
+def run_in_worker(
+    run_bot: Callable[[str, str], Awaitable[None]],
+    room_url: str,
+    token: str,
+    stop_event: Event,
+):
+    """Run one bot on its own event loop (uvloop if installed) in its bot process.
+
+    ``stop_event`` is a multiprocessing Event the server sets when the room is
+    deleted or the server shuts down.
+    """
+    _run_event_loop(_run_until_stopped(run_bot, room_url, token, stop_event))
@@ -0,0 +1,46 @@
+"""Voice-bot settings, read from the environment once per process."""
+
+import os
+from dataclasses import dataclass
+
+NVCF_GRPC_URL = "grpc.nvcf.nvidia.com:443"
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """NVIDIA endpoints and models used by ``run_voice_bot``.
+
+    Built with :meth:`from_env` at import time, after ``load_dotenv()``, so
+    every room in the bot process uses the same values and a missing API key stops
+    the server from starting instead of failing each room.
+    """
+
+    nvidia_api_key: str
+    asr_url: str
+    asr_function_id: str
+    asr_sample_rate: int
+    llm_base_url: str
+    llm_model: str
+    tts_url: str
+    tts_function_id: str
+    tts_voice_id: str
+    tts_sample_rate: int
+
+    @classmethod
+    def from_env(cls, *, llm_model: str) -> "Config":
+        """Read the environment; ``llm_model`` is the default for ``NVIDIA_LLM_MODEL``."""
+        nvidia_api_key = os.getenv("NVIDIA_API_KEY")
+        if not nvidia_api_key:
+            raise RuntimeError("NVIDIA_API_KEY not set")
+        return cls(
+            nvidia_api_key=nvidia_api_key,
+            asr_url=os.getenv("RIVA_ASR_URL", NVCF_GRPC_URL),
+            asr_function_id=os.getenv("RIVA_ASR_FUNCTION_ID", "1598d209-5e27-4d3c-8079-4751568b1081"),
+            asr_sample_rate=int(os.getenv("RIVA_ASR_SAMPLE_RATE", "16000")),
+            llm_base_url=os.getenv("NVIDIA_LLM_BASE_URL", "https://integrate.api.nvidia.com/v1"),
+            llm_model=os.getenv("NVIDIA_LLM_MODEL", llm_model),
+            tts_url=os.getenv("RIVA_TTS_URL", NVCF_GRPC_URL),
+            tts_function_id=os.getenv("RIVA_TTS_FUNCTION_ID", "877104f7-e885-42b9-8de8-f6e4c6303969"),
+            tts_voice_id=os.getenv("RIVA_TTS_VOICE_ID", "Magpie-Multilingual.EN-US.Sofia"),
+            tts_sample_rate=int(os.getenv("TTS_SAMPLE_RATE", "16000")),
+        )
@@ -0,0 +1,416 @@
+"""
+Shared FastAPI backend for the Daily.co voice bots.
+
+create_daily_app() builds the control-plane app each bot service serves:
+  POST   /room              → create Daily.co room, spawn bot, return room URL + user token
+  GET    /health            → health check
+  GET    /rooms             → list active rooms
+  DELETE /room/{room_name}  → stop bot and delete room
+  GET    /                  → service info
+"""
+
+import asyncio
+import functools
+import hashlib
+import multiprocessing
+import os
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from multiprocessing.synchronize import Event
+from typing import Callable, Optional
+
+import aiohttp
+import certifi
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from loguru import logger
+from pydantic import BaseModel
+
+DAILY_API_URL = "https://api.daily.co/v1"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Static parts of the Daily request bodies; only exp/name/user fields vary.
+_ROOM_BASE_PROPS = {
+    "enable_chat": False,
+    "enable_screenshare": False,
+    "start_video_off": True,
+    "start_audio_off": False,
+    "enable_knocking": False,
+    "enable_prejoin_ui": False,
+}
+_TOKEN_BASE_PROPS = {
+    "enable_screenshare": False,
+    "start_video_off": True,
+    "start_audio_off": False,
+}
+
+BOT_STOP_TIMEOUT = 5.0
+# Warm bot processes kept between rooms; each holds its models and caches.
+MAX_IDLE_BOTS = 2
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+BotEntry = Callable[[str, str, Event], None]
+
+
+# ---------------------------------------------------------------------------
+# Pydantic models
+# ---------------------------------------------------------------------------
+class RoomResponse(BaseModel):
+    room_url: str
+    room_name: str
+    token: str
+
+
+class HealthResponse(BaseModel):
+    status: str
+    service: str
+    daily_configured: bool
+    active_rooms: int
+
+
+# ---------------------------------------------------------------------------
+# Daily.co helpers
+# ---------------------------------------------------------------------------
+async def create_daily_room(
+    session: aiohttp.ClientSession, room_name: Optional[str] = None
+) -> dict:
+    """Create a new Daily.co room."""
+    room_config = {"properties": {**_ROOM_BASE_PROPS, "exp": int(time.time()) + 3600}}
+    if room_name:
+        room_config["name"] = room_name
+
+    async with session.post(
+        f"{DAILY_API_URL}/rooms", headers=_JSON_HEADERS, data=orjson.dumps(room_config)
+    ) as resp:
+        if resp.status != 200:
+            body = await resp.text()
+            raise HTTPException(status_code=resp.status, detail=f"Daily API error: {body}")
+        return await resp.json()
+
+
+async def get_daily_token(
+    session: aiohttp.ClientSession,
+    room_name: str,
+    is_owner: bool = False,
+    user_name: Optional[str] = None,
+) -> str:
+    """Get a meeting token for a Daily.co room."""
+    token_config = {
+        "properties": {
+            **_TOKEN_BASE_PROPS,
+            "room_name": room_name,
+            "is_owner": is_owner,
+            "exp": int(time.time()) + 3600,
+        }
+    }
+    if user_name:
+        token_config["properties"]["user_name"] = user_name
+
+    async with session.post(
+        f"{DAILY_API_URL}/meeting-tokens",
+        headers=_JSON_HEADERS,
+        data=orjson.dumps(token_config),
+    ) as resp:
+        if resp.status != 200:
+            body = await resp.text()
+            raise HTTPException(status_code=resp.status, detail=f"Daily token error: {body}")
+        data = await resp.json()
+        return data["token"]
+
+
+async def delete_daily_room(session: aiohttp.ClientSession, room_name: str):
+    """Delete a Daily.co room, ending the call for anyone still in it."""
+    async with session.delete(f"{DAILY_API_URL}/rooms/{room_name}") as resp:
+        if resp.status not in (200, 404):
+            logger.warning(f"Daily room delete failed for {room_name}: HTTP {resp.status}")
+
+
+# ---------------------------------------------------------------------------
+# Bot processes
+# ---------------------------------------------------------------------------
+def _bot_process_main(bot_entry: BotEntry, conn, stop_event: Event):
+    """Child process: run the bot in each room it's handed, one room at a time.
+
+    Unpickling ``bot_entry`` imports the bot module, so pipecat is loaded
+    while the process is still a spare, before any room is assigned. What
+    the bot caches per process (VAD model, FAQ embeddings, TTS audio, Riva
+    channels) carries over to the next room it serves.
+    """
+    while True:
+        try:
+            room_url, token = conn.recv()
+        except EOFError:
+            return  # retired
+        try:
+            bot_entry(room_url, token, stop_event)
+            ok = True
+        except Exception:
+            logger.exception(f"Bot failed in room {room_url}")
+            ok = False
+        try:
+            conn.send(ok)
+        except OSError:
+            return  # the server went away
+
+
+class _BotProcess:
+    """A process that runs one room at a time, so a crash (segfault, OOM kill) only ends that call."""
+
+    def __init__(self, bot_entry: BotEntry):
+        self._conn, child_conn = _MP_CONTEXT.Pipe()
+        self.stop_event = _MP_CONTEXT.Event()
+        self.process = _MP_CONTEXT.Process(
+            target=_bot_process_main, args=(bot_entry, child_conn, self.stop_event)
+        )
+        self.process.start()
+        child_conn.close()
+
+    def run(self, room_url: str, token: str) -> bool:
+        """Run the bot in a room and block until it leaves; ``False`` if it failed."""
+        self.stop_event.clear()
+        try:
+            self._conn.send((room_url, token))
+            return self._conn.recv()
+        except (EOFError, OSError):
+            # The process died; reap it so ``exitcode`` is set.
+            self.process.join()
+            return False
+
+    def retire(self):
+        """Let an idle process exit."""
+        self._conn.close()
+
+
+# ---------------------------------------------------------------------------
+# App factory
+# ---------------------------------------------------------------------------
+def create_daily_app(
+    title: str,
+    service_name: str,
+    bot_entry: BotEntry,
+    bot_user_name: str,
+) -> FastAPI:
+    """Build the FastAPI app that creates Daily.co rooms and runs ``bot_entry`` in them.
+
+    ``bot_entry`` must be a module-level function so it can be pickled into
+    the bot processes; its module is preloaded by each new process.
+    """
+    daily_api_key = os.getenv("DAILY_API_KEY", "")
+    max_active_bots = int(os.getenv("MAX_ACTIVE_BOTS", "20"))
+
+    active_bots: dict[str, asyncio.Task] = {}
+    # Rooms past the MAX_ACTIVE_BOTS check whose Daily calls are still in flight.
+    pending_rooms = 0
+
+    def _forget_bot(room_name: str, task: asyncio.Task):
+        """Done-callback: drop a finished bot unless the name was reused."""
+        if active_bots.get(room_name) is task:
+            del active_bots[room_name]
+
+    # ---- Lifespan -----------------------------------------------------------
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        logger.info(f"{title} server starting …")
+        # Load the CA bundle off the event loop; one context shared by the pool
+        # lets TLS sessions to api.daily.co be resumed.
+        app.state.ssl_ctx = await asyncio.to_thread(
+            ssl.create_default_context, cafile=certifi.where()
+        )
+        app.state.http_session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {daily_api_key}"},
+            connector=aiohttp.TCPConnector(
+                ssl=app.state.ssl_ctx,
+                limit=64,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75,
+            ),
+        )
+        # Waits on bot process exits without tying up the default executor.
+        app.state.bot_waiters = ThreadPoolExecutor(
+            max_workers=max_active_bots, thread_name_prefix="bot-wait"
+        )
+        # A warm spare, so no room pays for process start and the pipecat import.
+        app.state.idle_bots = [await asyncio.to_thread(_BotProcess, bot_entry)]
+        app.state.spare_starting = None
+        yield
+        logger.info("Shutting down — cancelling active bots …")
+        for room_name, task in active_bots.items():
+            task.cancel()
+            logger.info(f"Cancelled bot for room: {room_name}")
+        # Let each bot unwind its CancelledError handling before the loop and
+        # the shared session go away.
+        if active_bots:
+            # A little longer than spawn_bot's own stop timeout, so any bot
+            # that ignores the stop event is terminated before we move on.
+            _, pending = await asyncio.wait(list(active_bots.values()), timeout=BOT_STOP_TIMEOUT + 1)
+            if pending:
+                logger.warning(f"{len(pending)} bot(s) did not stop within {BOT_STOP_TIMEOUT}s")
+        if app.state.spare_starting is not None:
+            await asyncio.wait([app.state.spare_starting])
+        for bot in app.state.idle_bots:
+            bot.retire()
+        app.state.bot_waiters.shutdown(wait=False)
+        await app.state.http_session.close()
+
+    app = FastAPI(title=title, lifespan=lifespan, default_response_class=ORJSONResponse)
+
+    # CORS — allow CF Worker and local dev origins
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=512)
+
+    # ---- Bot spawning -------------------------------------------------------
+    async def _start_spare_bot():
+        app.state.idle_bots.append(await asyncio.to_thread(_BotProcess, bot_entry))
+
+    async def _take_bot() -> _BotProcess:
+        """Hand out a warm idle process, and start a spare once none are left."""
+        idle = app.state.idle_bots
+        while True:
+            while idle:
+                bot = idle.pop()
+                if bot.process.is_alive():
+                    break
+            else:
+                bot = None
+            starting = app.state.spare_starting
+            if not idle and (starting is None or starting.done()):
+                starting = app.state.spare_starting = asyncio.create_task(_start_spare_bot())
+            if bot is not None:
+                return bot
+            # Every process is busy; wait for the spare rather than start two.
+            await asyncio.shield(starting)
+
+    def _release_bot(bot: _BotProcess):
+        """Keep a process that finished its room for the next one, up to MAX_IDLE_BOTS."""
+        if bot.process.is_alive() and len(app.state.idle_bots) < MAX_IDLE_BOTS:
+            app.state.idle_bots.append(bot)
+        else:
+            bot.retire()
+
+    async def spawn_bot(room_url: str, token: str, room_name: str):
+        """Run the voice agent bot for a room in one of the bot processes."""
+        try:
+            bot = await _take_bot()
+        except OSError as e:
+            logger.error(f"Could not start a bot process for room {room_name}: {e}")
+            await delete_daily_room(app.state.http_session, room_name)
+            return
+        logger.info(f"Spawning bot for room: {room_name}")
+        finished = asyncio.get_running_loop().run_in_executor(
+            app.state.bot_waiters, bot.run, room_url, token
+        )
+        try:
+            ok = await asyncio.shield(finished)
+        except asyncio.CancelledError:
+            # Ask the pipeline to shut down cleanly; kill it if it doesn't.
+            bot.stop_event.set()
+            done, _ = await asyncio.wait([finished], timeout=BOT_STOP_TIMEOUT)
+            if done:
+                _release_bot(bot)
+            else:
+                logger.warning(f"Bot for room {room_name} did not stop, terminating it")
+                bot.process.terminate()
+            logger.info(f"Bot cancelled for room: {room_name}")
+            return
+        if ok:
+            _release_bot(bot)
+            return
+        # The user would be left in a room with nobody answering.
+        if bot.process.is_alive():
+            logger.error(f"Bot for room {room_name} failed")
+            _release_bot(bot)
+        else:
+            logger.error(f"Bot process for room {room_name} exited with code {bot.process.exitcode}")
+        await delete_daily_room(app.state.http_session, room_name)
+
+    # ---- Endpoints ----------------------------------------------------------
+    # Service info never changes at runtime — serialize once and let clients
+    # revalidate with If-None-Match.
+    root_bytes = orjson.dumps({
+        "service": title,
+        "version": "1.0.0",
+        "endpoints": {
+            "POST /room": "Create room and spawn bot",
+            "GET /health": "Health check",
+            "GET /rooms": "List active rooms",
+            "DELETE /room/{room_name}": "Stop bot and delete room",
+        },
+    })
+    root_etag = f'"{hashlib.sha1(root_bytes).hexdigest()}"'
+
+    @app.get("/")
+    async def root(request: Request):
+        if request.headers.get("if-none-match") == root_etag:
+            return Response(status_code=304, headers={"ETag": root_etag})
+        return Response(content=root_bytes, media_type="application/json", headers={"ETag": root_etag})
+
+    @app.get("/health")
+    async def health_check():
+        return HealthResponse(
+            status="healthy",
+            service=service_name,
+            daily_configured=bool(daily_api_key),
+            active_rooms=len(active_bots),
+        )
+
+    @app.post("/room")
+    async def create_room(room_name: Optional[str] = None):
+        """Create a new Daily.co room and spawn a voice bot in it."""
+        if not daily_api_key:
+            raise HTTPException(status_code=500, detail="DAILY_API_KEY not configured")
+        nonlocal pending_rooms
+        if len(active_bots) + pending_rooms >= max_active_bots:
+            raise HTTPException(status_code=503, detail="Too many active rooms, try again later")
+
+        # Hold the slot across the Daily calls so concurrent requests can't
+        # all pass the check; it is released on failure or once the bot is
+        # in active_bots.
+        pending_rooms += 1
+        try:
+            session = app.state.http_session
+            room = await create_daily_room(session, room_name)
+            room_url = room["url"]
+            actual_room_name = room["name"]
+
+            bot_token, user_token = await asyncio.gather(
+                get_daily_token(session, actual_room_name, is_owner=True, user_name=bot_user_name),
+                get_daily_token(session, actual_room_name, is_owner=False, user_name="User"),
+            )
+
+            task = asyncio.create_task(spawn_bot(room_url, bot_token, actual_room_name))
+            active_bots[actual_room_name] = task
+            task.add_done_callback(functools.partial(_forget_bot, actual_room_name))
+        finally:
+            pending_rooms -= 1
+
+        logger.info(f"Room created: {actual_room_name} → {room_url}")
+        return RoomResponse(room_url=room_url, room_name=actual_room_name, token=user_token)
+
+    @app.get("/rooms")
+    async def list_rooms():
+        return {"active_rooms": list(active_bots.keys()), "count": len(active_bots)}
+
+    @app.delete("/room/{room_name}")
+    async def delete_room(room_name: str):
+        """Stop bot and delete a room."""
+        if room_name in active_bots:
+            active_bots[room_name].cancel()
+            del active_bots[room_name]
+
+        await delete_daily_room(app.state.http_session, room_name)
+        return {"status": "deleted", "room_name": room_name}
+
+    return app
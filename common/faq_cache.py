@@ -0,0 +1,153 @@
+"""
+Semantic matching of user questions against a fixed FAQ list.
+
+Callers of a narrow FAQ bot keep asking the same things in different words
+("how much is the quantum course?" / "quantum course price?"). The bot
+supplies a few phrasings of each common question with a hand-written answer;
+a user turn close enough to one of them is answered directly, without an LLM
+call.
+
+Only these fixed answers are ever served. Answers the LLM generates are not
+cached: they can depend on earlier turns, tool results or details the caller
+gave, and the embedded FAQ list is shared by every room a bot process
+serves.
+
+Embeddings come from fastembed (ONNX MiniLM). If it isn't installed, or the
+model can't be loaded, the cache disables itself and passes every frame
+through.
+"""
+
+import asyncio
+import functools
+from typing import Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from pipecat.frames.frames import Frame, LLMContextFrame, TTSSpeakFrame
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContextFrame
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from common.tts import CachedRivaTTSService
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SIMILARITY_THRESHOLD = 0.92
+# Short follow-ups ("yes", "go on") depend on the conversation, not the words;
+# three words is already enough for a question like "quantum course price?".
+MIN_WORDS = 3
+
+# (question phrasings, answer)
+FAQ = tuple[tuple[str, ...], str]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_embedder():
+    try:
+        from fastembed import TextEmbedding
+    except ImportError:
+        logger.warning("fastembed not installed — FAQ cache disabled")
+        return None
+    try:
+        return TextEmbedding(EMBEDDING_MODEL)
+    except Exception as e:
+        # Cached as None, so a bad download or ONNX runtime isn't retried per turn.
+        logger.warning(f"FAQ embedding model failed to load — FAQ cache disabled: {e}")
+        return None
+
+
+def _embed(texts: Sequence[str]) -> Optional[np.ndarray]:
+    """Unit-length embeddings of ``texts``, one per row."""
+    embedder = _load_embedder()
+    if embedder is None:
+        return None
+    vectors = np.stack(list(embedder.embed(list(texts)))).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class _AnswerStore:
+    """Embedded FAQ phrasings and the answer each one maps to."""
+
+    def __init__(self, matrix: np.ndarray, answers: list[str]):
+        self._matrix = matrix
+        self._answers = answers
+
+    def get(self, vector: np.ndarray) -> Optional[str]:
+        scores = self._matrix @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < SIMILARITY_THRESHOLD:
+            return None
+        return self._answers[best]
+
+
+@functools.lru_cache(maxsize=4)
+def _load_store(faqs: tuple[FAQ, ...]) -> Optional[_AnswerStore]:
+    """Embed every phrasing once per bot process; its later rooms reuse the result."""
+    questions = [q for phrasings, _ in faqs for q in phrasings]
+    answers = [answer for phrasings, answer in faqs for _ in phrasings]
+    if not questions:
+        return None
+    try:
+        matrix = _embed(questions)
+    except Exception as e:
+        logger.warning(f"Embedding the FAQ list failed — FAQ cache disabled: {e}")
+        return None
+    return _AnswerStore(matrix, answers) if matrix is not None else None
+
+
+def _last_user_text(messages: list) -> Optional[str]:
+    """The text of the turn that triggered this inference, if it ends the context."""
+    if not messages:
+        return None
+    last = messages[-1]
+    if not isinstance(last, dict) or last.get("role") != "user":
+        return None
+    if not isinstance(last.get("content"), str):
+        return None
+    return last["content"]
+
+
+class FAQCache(FrameProcessor):
+    """Answer user turns that match a fixed FAQ entry without running the LLM.
+
+    Goes between the user context aggregator and the LLM, so it sees each
+    complete user turn rather than individual transcript fragments. On a hit
+    it swallows the context frame, records the answer in the context and
+    speaks it. The audio of an answer's first hit is kept by the TTS, so
+    only answers that are actually asked for cost a Riva call, and only once.
+    """
+
+    def __init__(self, faqs: Sequence[FAQ], tts: CachedRivaTTSService, **kwargs):
+        super().__init__(**kwargs)
+        self._tts = tts
+        self._faqs = tuple((tuple(phrasings), answer) for phrasings, answer in faqs)
+
+    async def warmup(self):
+        """Load the embedding model and embed the FAQ list now rather than on the first question."""
+        await asyncio.to_thread(_load_store, self._faqs)
+
+    def _match(self, text: str) -> Optional[str]:
+        store = _load_store(self._faqs)
+        if store is None:
+            return None
+        vectors = _embed([text])
+        return store.get(vectors[0]) if vectors is not None else None
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, (OpenAILLMContextFrame, LLMContextFrame)):
+            text = _last_user_text(frame.context.get_messages())
+            if text is not None and len(text.split()) >= MIN_WORDS:
+                try:
+                    answer = await asyncio.to_thread(self._match, text)
+                except Exception as e:
+                    logger.warning(f"{self}: FAQ lookup failed: {e}")
+                    answer = None
+                if answer is not None:
+                    logger.debug("{}: FAQ cache hit for [{}]", self, text)
+                    frame.context.add_message({"role": "assistant", "content": answer})
+                    self._tts.pin_next(answer)
+                    await self.push_frame(TTSSpeakFrame(answer))
+                    return
+        await self.push_frame(frame, direction)
+
@@ -0,0 +1,99 @@
+"""NVIDIA NIM LLM service and context tuned for a fixed, prefix-cached system prompt."""
+
+import copy
+from typing import Any
+
+from loguru import logger
+
+from pipecat.metrics.metrics import LLMTokenUsage
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.services.nvidia.llm import NvidiaLLMService
+
+
+class PrefixCachedNvidiaLLMService(NvidiaLLMService):
+    """NvidiaLLMService that reports how much of each prompt was served from cache.
+
+    NIM's OpenAI-compatible endpoints reuse the KV cache for any byte-identical
+    prompt prefix, so nothing has to be tagged in the request — callers only
+    need to keep the system prompt as the first, unmodified message. The stock
+    service drops ``cached_tokens`` when it folds NIM's incremental usage into a
+    single report; this keeps it so cache hits show up in the usage metrics.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._cache_read_tokens = 0
+
+    async def _process_context(self, context: OpenAILLMContext | LLMContext):
+        self._prompt_tokens = 0
+        self._completion_tokens = 0
+        self._cache_read_tokens = 0
+        self._has_reported_prompt_tokens = False
+        self._is_processing = True
+
+        try:
+            # Bypass NvidiaLLMService's wrapper: its final report has no cache field.
+            await super(NvidiaLLMService, self)._process_context(context)
+        finally:
+            self._is_processing = False
+            if self._prompt_tokens > 0 or self._completion_tokens > 0:
+                self._total_tokens = self._prompt_tokens + self._completion_tokens
+                tokens = LLMTokenUsage(
+                    prompt_tokens=self._prompt_tokens,
+                    completion_tokens=self._completion_tokens,
+                    total_tokens=self._total_tokens,
+                    cache_read_input_tokens=self._cache_read_tokens or None,
+                )
+                await super(NvidiaLLMService, self).start_llm_usage_metrics(tokens)
+
+    async def warmup(self, context: OpenAILLMContext):
+        """Send a one-token completion so the HTTPS connection and cached prefix are hot.
+
+        The request carries ``context``'s system prompt, tools and settings,
+        built the same way as a real turn, so the prefix NIM caches is the one
+        the conversation's requests start with.
+        """
+        params = self.build_chat_completion_params({
+            "messages": [context.get_messages()[0], {"role": "user", "content": "."}],
+            "tools": context.tools,
+            "tool_choice": context.tool_choice,
+        })
+        params.update(stream=False, max_tokens=1)
+        params.pop("stream_options", None)
+        try:
+            await self._client.chat.completions.create(**params)
+            logger.debug(f"{self}: warmed up")
+        except Exception as e:
+            logger.warning(f"{self}: warmup failed: {e}")
+
+    async def start_llm_usage_metrics(self, tokens: LLMTokenUsage):
+        if self._is_processing and tokens.cache_read_input_tokens:
+            self._cache_read_tokens = max(self._cache_read_tokens, tokens.cache_read_input_tokens)
+        await super().start_llm_usage_metrics(tokens)
+
+
+class FixedPrefixLLMContext(OpenAILLMContext):
+    """OpenAILLMContext whose first message is a fixed system prompt.
+
+    The LLM service logs ``get_messages_for_logging()`` inside an f-string on
+    every turn, so the list's repr is built even when DEBUG is filtered out,
+    and that repr escapes and copies the whole multi-KB system prompt again.
+    The prompt never changes, so it is stood in for by a short placeholder
+    built once. Voice contexts hold no images, so the remaining messages only
+    need copying.
+    """
+
+    def __init__(self, messages: list[dict], **kwargs):
+        super().__init__(messages, **kwargs)
+        self._system = messages[0]
+        self._system_for_logging = {
+            "role": "system",
+            "content": f"<system prompt, {len(self._system['content'])} chars>",
+        }
+
+    def get_messages_for_logging(self) -> list[dict[str, Any]]:
+        messages = self.get_messages()
+        if not messages or messages[0] is not self._system:
+            return super().get_messages_for_logging()
+        return [self._system_for_logging, *(copy.deepcopy(m) for m in messages[1:])]
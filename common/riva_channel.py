@@ -0,0 +1,22 @@
+"""Long-lived gRPC channels to Riva on NVCF, reused by the rooms a bot process serves."""
+
+import functools
+
+import riva.client
+
+
+@functools.lru_cache(maxsize=8)
+def shared_auth(use_ssl: bool, uri: str, function_id: str, api_key: str) -> riva.client.Auth:
+    """One channel per endpoint and function for the life of the bot process.
+
+    Each room runs on a fresh event loop, so services and the LLM's async HTTP
+    client can't outlive it, but the Riva gRPC channels are synchronous and
+    thread-safe. Reusing them lets every room after the first that a bot
+    process serves skip the TLS handshake.
+    """
+    return riva.client.Auth(
+        None,
+        use_ssl,
+        uri,
+        [["function-id", function_id], ["authorization", f"Bearer {api_key}"]],
+    )
@@ -0,0 +1,86 @@
+"""Riva STT service with an early-warmed channel and a thread-friendly audio handoff."""
+
+import asyncio
+import queue
+from typing import AsyncGenerator
+
+import riva.client
+import riva.client.proto.riva_asr_pb2 as rasr
+from loguru import logger
+
+from pipecat.frames.frames import Frame, StartFrame
+from pipecat.services.nvidia.stt import NvidiaSTTService
+
+from common.riva_channel import shared_auth
+
+# Unblocks the gRPC request thread so the stream can close.
+_END_OF_AUDIO = None
+
+
+class RivaSTTService(NvidiaSTTService):
+    """NvidiaSTTService with a :meth:`warmup` hook and a ``queue.Queue`` audio handoff.
+
+    The stock service dials Riva in ``start()``, so the first user utterance
+    pays for the TLS handshake and any NVCF cold start. Calling ``warmup()``
+    while the bot is still joining the room moves that cost off the first turn.
+
+    Audio reaches Riva from a gRPC request thread. The stock iterator fetches
+    every 20 ms chunk from an ``asyncio.Queue`` with ``run_coroutine_threadsafe``,
+    which costs an event-loop round-trip per chunk. Here the loop drops chunks
+    into a thread-safe queue and the request thread blocks on it directly,
+    sending whatever has piled up as one message.
+    """
+
+    def _initialize_client(self):
+        # start() calls this unconditionally; keep the channel warmup() opened.
+        if self._asr_service is None:
+            auth = shared_auth(self._use_ssl, self._server, self._function_id, self._api_key)
+            self._asr_service = riva.client.ASRService(auth)
+
+    def _ping(self):
+        self._initialize_client()
+        self._asr_service.stub.GetRivaSpeechRecognitionConfig(
+            rasr.RivaSpeechRecognitionConfigRequest()
+        )
+
+    async def warmup(self):
+        """Open the gRPC channel with one cheap unary call."""
+        try:
+            await asyncio.to_thread(self._ping)
+            logger.debug(f"{self}: warmed up")
+        except Exception as e:
+            logger.warning(f"{self}: warmup failed: {e}")
+
+    async def start(self, frame: StartFrame):
+        # Fresh queue per run so a stale end marker can't close the new stream.
+        self._audio_queue = queue.Queue()
+        await super().start(frame)
+
+    async def _stop_tasks(self):
+        if self._thread_task:
+            self._audio_queue.put(_END_OF_AUDIO)
+        await super()._stop_tasks()
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        await self.start_processing_metrics()
+        self._audio_queue.put_nowait(audio)
+        yield None
+
+    def __next__(self) -> bytes:
+        if not self._thread_running:
+            raise StopIteration
+        chunk = self._audio_queue.get()
+        if chunk is _END_OF_AUDIO:
+            raise StopIteration
+        # Batch any backlog (e.g. after a GIL stall) into one request message.
+        chunks = [chunk]
+        while True:
+            try:
+                chunk = self._audio_queue.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is _END_OF_AUDIO:
+                self._audio_queue.put(_END_OF_AUDIO)
+                break
+            chunks.append(chunk)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
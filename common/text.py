@@ -0,0 +1,120 @@
+"""Text aggregation for the LLM → TTS hop."""
+
+import asyncio
+from typing import AsyncIterator, Optional
+
+from pipecat.frames.frames import Frame, InterruptionFrame, LLMTextFrame
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.utils.text.base_text_aggregator import Aggregation, AggregationType, BaseTextAggregator
+
+_CLAUSE_END = frozenset(",.!?…;:")
+_SENTENCE_END = frozenset(".!?…")
+
+
+class ClauseTextAggregator(BaseTextAggregator):
+    """Release text at the first clause boundary or after ``max_words`` words.
+
+    Pipecat's default aggregator holds LLM tokens until a full sentence is
+    complete, so a long opening sentence delays the first audio. Handing
+    Riva clause-sized pieces lets it start speaking after a few tokens.
+    Punctuation only counts when followed by whitespace, so ``$29.95`` or
+    ``1,000`` are never split.
+    """
+
+    def __init__(self, max_words: int = 8):
+        self._max_words = max_words
+        self._text = ""
+        self._words = 0
+
+    @property
+    def text(self) -> Aggregation:
+        return Aggregation(text=self._text.strip(" "), type=AggregationType.SENTENCE)
+
+    async def aggregate(self, text: str) -> AsyncIterator[Aggregation]:
+        for char in text:
+            if char.isspace() and self._text and not self._text[-1].isspace():
+                self._words += 1
+                if self._text[-1] in _CLAUSE_END or self._words >= self._max_words:
+                    result = self._text.strip()
+                    await self.reset()
+                    yield Aggregation(text=result, type=AggregationType.SENTENCE)
+                    continue
+            self._text += char
+
+    async def flush(self) -> Optional[Aggregation]:
+        result = self._text.strip()
+        await self.reset()
+        if result:
+            return Aggregation(text=result, type=AggregationType.SENTENCE)
+        return None
+
+    async def handle_interruption(self):
+        await self.reset()
+
+    async def reset(self):
+        self._text = ""
+        self._words = 0
+
+
+class CoalesceTextFrames(FrameProcessor):
+    """Merge LLM token deltas that arrive within ``window_ms`` into one frame.
+
+    NIM streams roughly one ``LLMTextFrame`` per token, and each one pays a
+    queue hop through every downstream processor. Deltas are held for up to
+    ``window_ms`` and forwarded as a single frame; a sentence end, or any
+    other frame, flushes immediately so ordering and latency are preserved.
+    """
+
+    def __init__(self, *, window_ms: int = 20, **kwargs):
+        super().__init__(**kwargs)
+        self._window = window_ms / 1000
+        self._text = ""
+        self._skip_tts: Optional[bool] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Serializes the timer's flush with frames pushed from process_frame.
+        self._lock = asyncio.Lock()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, LLMTextFrame):
+            if self._text and frame.skip_tts != self._skip_tts:
+                await self._flush()
+            self._text += frame.text
+            self._skip_tts = frame.skip_tts
+            if frame.text.rstrip()[-1:] in _SENTENCE_END:
+                await self._flush()
+            elif self._flush_task is None:
+                self._flush_task = self.create_task(self._flush_later())
+            return
+
+        if isinstance(frame, InterruptionFrame):
+            await self._cancel_flush_task()
+            self._text = ""
+        else:
+            await self._flush()
+        async with self._lock:
+            await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        await self._cancel_flush_task()
+
+    async def _flush_later(self):
+        await asyncio.sleep(self._window)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self):
+        async with self._lock:
+            if not self._text:
+                return
+            frame = LLMTextFrame(self._text)
+            frame.skip_tts = self._skip_tts
+            self._text = ""
+            await self.push_frame(frame)
+
+    async def _cancel_flush_task(self):
+        if self._flush_task:
+            await self.cancel_task(self._flush_task)
+            self._flush_task = None
@@ -0,0 +1,210 @@
+"""Riva TTS service that replays pre-synthesized audio for fixed and repeated phrases."""
+
+import asyncio
+from collections import OrderedDict
+from typing import AsyncGenerator, Iterator, Optional
+
+import riva.client
+from loguru import logger
+
+from pipecat.frames.frames import (
+    Frame,
+    StartFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.services.nvidia.tts import NvidiaTTSService
+
+from common.riva_channel import shared_auth
+
+_CHUNK_MS = 20
+_RECENT_MAX = 64
+# Lines synthesized once, remembered so a second time is recognized as a repeat.
+_SEEN_MAX = 512
+
+
+class CachedRivaTTSService(NvidiaTTSService):
+    """NvidiaTTSService that speaks precached phrases straight from memory.
+
+    Lines that never change, such as the welcome message, are synthesized once
+    per bot process with :meth:`precache`. After that, speaking the same
+    text streams the stored PCM without a Riva round-trip. Lines synthesized
+    live are kept in a small LRU once they have been spoken a second time, so
+    a recurring "Sorry, could you say that again?" stops costing Riva calls
+    while one-off clauses never displace it.
+    """
+
+    # Shared by the rooms a bot process serves, one after another: the audio
+    # only depends on the key.
+    # Precached phrases are kept for good; repeated live lines are LRU.
+    _pcm_cache: dict[tuple, bytes] = {}
+    _recent: OrderedDict[tuple, bytes] = OrderedDict()
+    _seen: OrderedDict[tuple, None] = OrderedDict()
+    _pin_next: set[tuple] = set()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._config_fetch: Optional[asyncio.Task] = None
+        # Precaches still synthesizing, so run_tts can wait for them.
+        self._precaching: dict[tuple, asyncio.Task] = {}
+
+    def _cache_key(self, text: str) -> tuple:
+        return (self._voice_id, self._init_sample_rate, text.strip())
+
+    def _initialize_client(self):
+        if self._service is None:
+            auth = shared_auth(self._use_ssl, self._server, self._function_id, self._api_key)
+            self._service = riva.client.SpeechSynthesisService(auth)
+
+    def _synthesize_pcm(self, text: str) -> bytes:
+        """Blocking one-shot synthesis; run it off the event loop."""
+        self._initialize_client()
+        responses = self._service.synthesize_online(
+            text,
+            self._voice_id,
+            self._language_code,
+            sample_rate_hz=self._init_sample_rate,
+            zero_shot_audio_prompt_file=None,
+            zero_shot_quality=self._quality,
+            custom_dictionary={},
+        )
+        return b"".join(resp.audio for resp in responses)
+
+    async def _precache(self, key: tuple, text: str):
+        try:
+            # Opens the channel first, so two threads never race to create it.
+            await self._ensure_config()
+            self._pcm_cache[key] = await asyncio.to_thread(self._synthesize_pcm, text)
+            logger.debug(f"{self}: precached [{text}]")
+        except Exception as e:
+            logger.warning(f"{self}: precache failed, will synthesize live: {e}")
+        finally:
+            self._precaching.pop(key, None)
+
+    def _start_precache(self, text: str) -> Optional[asyncio.Task]:
+        key = self._cache_key(text)
+        if key in self._pcm_cache:
+            return None
+        task = self._precaching.get(key)
+        if task is None:
+            task = self._precaching[key] = asyncio.create_task(self._precache(key, text))
+        return task
+
+    async def precache(self, text: str):
+        """Synthesize ``text`` into the process-wide cache unless it is already there."""
+        task = self._start_precache(text)
+        if task is not None:
+            await asyncio.shield(task)
+
+    def pin_next(self, text: str):
+        """Keep the audio of the next complete live synthesis of ``text`` for good.
+
+        For text known to recur, such as a fixed FAQ answer on its first hit:
+        the audio Riva produces anyway is kept, rather than synthesized twice.
+        """
+        key = self._cache_key(text)
+        if key not in self._pcm_cache:
+            self._pin_next.add(key)
+
+    def _fetch_config(self):
+        self._initialize_client()
+        self._config = self._create_synthesis_config()
+
+    async def _ensure_config(self):
+        """Fetch the synthesis config in a thread, once, for warmup() and start() alike."""
+        fetch = self._config_fetch
+        if fetch is None or (fetch.done() and (fetch.cancelled() or fetch.exception())):
+            fetch = self._config_fetch = asyncio.create_task(asyncio.to_thread(self._fetch_config))
+        # Shielded so a cancelled warmup doesn't abort the fetch start() waits on.
+        await asyncio.shield(fetch)
+
+    async def start(self, frame: StartFrame):
+        # NvidiaTTSService.start() fetches the synthesis config with a blocking
+        # gRPC call on the event loop; wait for warmup()'s fetch instead.
+        await super(NvidiaTTSService, self).start(frame)
+        if self._config is None:
+            await self._ensure_config()
+
+    async def warmup(self, *phrases: str):
+        """Open the gRPC channel and fetch the synthesis config, then precache ``phrases``."""
+        # Registered before the first await, so speaking a phrase while it is
+        # still being precached waits for that audio instead of synthesizing
+        # it a second time.
+        precaching = [task for task in map(self._start_precache, phrases) if task is not None]
+        try:
+            await self._ensure_config()
+            logger.debug(f"{self}: warmed up")
+        except Exception as e:
+            logger.warning(f"{self}: warmup failed: {e}")
+        for task in precaching:
+            await asyncio.shield(task)
+
+    def _lookup(self, key: tuple) -> Optional[bytes]:
+        pcm = self._pcm_cache.get(key)
+        if pcm is None:
+            pcm = self._recent.get(key)
+            if pcm is not None:
+                self._recent.move_to_end(key)
+        return pcm
+
+    def _seen_before(self, key: tuple) -> bool:
+        """Whether ``key`` was synthesized recently; records it either way."""
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return True
+        self._seen[key] = None
+        if len(self._seen) > _SEEN_MAX:
+            self._seen.popitem(last=False)
+        return False
+
+    def _remember(self, key: tuple, pcm: bytes):
+        self._recent[key] = pcm
+        if len(self._recent) > _RECENT_MAX:
+            self._recent.popitem(last=False)
+
+    def _speak_cached_pcm(self, pcm: bytes) -> Iterator[Frame]:
+        """Frames that play ``pcm`` in 20 ms chunks, bracketed like a live synthesis."""
+        chunk_size = self.sample_rate * 2 * _CHUNK_MS // 1000
+        yield TTSStartedFrame()
+        for i in range(0, len(pcm), chunk_size):
+            yield TTSAudioRawFrame(
+                audio=pcm[i : i + chunk_size], sample_rate=self.sample_rate, num_channels=1
+            )
+        yield TTSStoppedFrame()
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        key = self._cache_key(text)
+        precaching = self._precaching.get(key)
+        if precaching is not None:
+            # The welcome line can be greeted with before warmup has finished it.
+            await asyncio.shield(precaching)
+        pcm = self._lookup(key)
+        if pcm is not None:
+            for frame in self._speak_cached_pcm(pcm):
+                yield frame
+            return
+
+        pin = key in self._pin_next
+        if not self._seen_before(key) and not pin:
+            async for frame in super().run_tts(text):
+                yield frame
+            return
+
+        # Pinned, or the second time this line is spoken: it recurs, so keep
+        # its audio if it synthesizes completely. An interruption closes this
+        # generator early, so partial audio is never stored.
+        chunks = []
+        complete = False
+        async for frame in super().run_tts(text):
+            if isinstance(frame, TTSAudioRawFrame):
+                chunks.append(frame.audio)
+            elif isinstance(frame, TTSStoppedFrame):
+                complete = True
+            yield frame
+        if complete and chunks:
+            if pin:
+                self._pcm_cache[key] = b"".join(chunks)
+                self._pin_next.discard(key)
+            else:
+                self._remember(key, b"".join(chunks))
@@ -0,0 +1,84 @@
+"""
+Silero VAD with the ONNX model loaded once per bot process and reused by
+each room it serves, plus the VAD tuning and transcript gate the voice bots
+share.
+"""
+
+import copy
+import functools
+import time
+from typing import Optional
+
+from loguru import logger
+
+from pipecat.audio.vad.silero import SileroOnnxModel, SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from pipecat.frames.frames import (
+    Frame,
+    InterimTranscriptionFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+    VADUserStartedSpeakingFrame,
+    VADUserStoppedSpeakingFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+# Short FAQ questions rarely pause mid-sentence, so 350 ms of silence ends the
+# turn (raise stop_secs toward 0.45 if trailing speech gets cut off). The lower
+# confidence and volume catch quiet speakers; voiced segments shorter than
+# start_secs still never open a user turn.
+VOICE_VAD_PARAMS = VADParams(confidence=0.6, start_secs=0.3, stop_secs=0.35, min_volume=0.5)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_silero_model() -> SileroOnnxModel:
+    return SileroVADAnalyzer()._model
+
+
+class SharedSileroVADAnalyzer(SileroVADAnalyzer):
+    """SileroVADAnalyzer that reuses one ONNX inference session per process.
+
+    The stock analyzer reads the model from disk and builds a new
+    InferenceSession on every construction. The session is stateless; the
+    recurrent state lives on the SileroOnnxModel wrapper, so each analyzer
+    gets a shallow copy of the cached wrapper with its own reset state.
+    """
+
+    def __init__(self, *, sample_rate: Optional[int] = None, params: Optional[VADParams] = None):
+        VADAnalyzer.__init__(self, sample_rate=sample_rate, params=params)
+        self._model = copy.copy(_load_silero_model())
+        self._model.reset_states()
+        self._last_reset_time = 0
+
+
+class VADGatedTranscriptFilter(FrameProcessor):
+    """Drop transcripts that don't belong to a VAD-confirmed utterance.
+
+    Riva streams continuously and will transcribe a cough or a short "um"
+    that Silero never accepted as speech; the user aggregator would then
+    emulate a turn and run the LLM on it. Transcripts are only forwarded
+    while the user is speaking or within ``grace_secs`` of them stopping,
+    which leaves room for Riva's final result to arrive.
+    """
+
+    def __init__(self, *, grace_secs: float = 2.0, **kwargs):
+        super().__init__(**kwargs)
+        self._grace_secs = grace_secs
+        self._speaking = False
+        self._stopped_at = float("-inf")
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, (UserStartedSpeakingFrame, VADUserStartedSpeakingFrame)):
+            self._speaking = True
+        elif isinstance(frame, (UserStoppedSpeakingFrame, VADUserStoppedSpeakingFrame)):
+            if self._speaking:
+                self._speaking = False
+                self._stopped_at = time.monotonic()
+        elif isinstance(frame, (TranscriptionFrame, InterimTranscriptionFrame)):
+            if not self._speaking and time.monotonic() - self._stopped_at > self._grace_secs:
+                logger.debug("{}: dropping transcript outside speech [{}]", self, frame.text)
+                return
+        await self.push_frame(frame, direction)
@@ -0,0 +1,181 @@
+"""
+The Daily ↔ Riva STT ↔ NVIDIA LLM ↔ Riva TTS pipeline both voice agents run.
+
+Each agent describes itself with a :class:`VoiceBot` (prompt, welcome line,
+tools, FAQs); :func:`run_voice_bot` builds and runs the pipeline for one room.
+"""
+
+import asyncio
+import functools
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Mapping
+
+from loguru import logger
+from openai import NOT_GIVEN, NotGiven
+
+from pipecat.adapters.schemas.tools_schema import ToolsSchema
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_text_processor import LLMTextProcessor
+from pipecat.transports.daily.transport import DailyParams, DailyTransport
+
+from common.bot_runner import greet_first_participant
+from common.config import Config
+from common.faq_cache import FAQ, FAQCache
+from common.llm import FixedPrefixLLMContext, PrefixCachedNvidiaLLMService
+from common.stt import RivaSTTService
+from common.text import ClauseTextAggregator, CoalesceTextFrames
+from common.tts import CachedRivaTTSService
+from common.vad import VOICE_VAD_PARAMS, SharedSileroVADAnalyzer, VADGatedTranscriptFilter
+
+
+@dataclass(frozen=True, slots=True)
+class VoiceBot:
+    """What sets one voice agent apart from the other.
+
+    ``functions`` maps tool names in ``tools`` to their handlers; ``faqs``
+    are answered without the LLM (see :class:`common.faq_cache.FAQCache`).
+    """
+
+    name: str
+    config: Config
+    participant_name: str
+    system_prompt: str
+    welcome_message: str
+    tools: ToolsSchema | NotGiven = NOT_GIVEN
+    functions: Mapping[str, Callable] = field(default_factory=dict)
+    faqs: tuple[FAQ, ...] = ()
+
+
+@functools.lru_cache(maxsize=4)
+def _system_messages(system_prompt: str) -> tuple[dict, ...]:
+    """The system message every room of a bot starts its context with.
+
+    run_voice_bot copies the tuple into a fresh list so each context can grow
+    independently while the system message itself is reused. It must stay
+    first and byte-identical so NIM's prefix cache keeps hitting. Kept a plain
+    dict: pipecat deep-copies messages for logging and the OpenAI client
+    JSON-encodes them, and neither accepts a MappingProxyType.
+    """
+    return ({"role": "system", "content": sys.intern(system_prompt)},)
+
+
+async def run_voice_bot(bot: VoiceBot, room_url: str, token: str):
+    """Run ``bot`` in a Daily.co room until the participant leaves or it is cancelled."""
+    logger.info(f"Starting {bot.name} bot in room: {room_url}")
+    config = bot.config
+
+    # ---- Daily.co transport ------------------------------------------------
+    transport = DailyTransport(
+        room_url,
+        token,
+        bot.participant_name,
+        DailyParams(
+            audio_in_enabled=True,
+            audio_out_enabled=True,
+            vad_analyzer=SharedSileroVADAnalyzer(params=VOICE_VAD_PARAMS),
+            transcription_enabled=False,
+        ),
+    )
+
+    # ---- NVIDIA Riva STT (Parakeet RNNT) -----------------------------------
+    stt = RivaSTTService(
+        api_key=config.nvidia_api_key,
+        server=config.asr_url,
+        model_function_map={
+            "function_id": config.asr_function_id,
+            "model_name": "parakeet-ctc-1.1b-asr",
+        },
+        sample_rate=config.asr_sample_rate,
+    )
+    logger.info("Riva STT ready (Parakeet)")
+
+    # ---- NVIDIA LLM --------------------------------------------------------
+    llm = PrefixCachedNvidiaLLMService(
+        api_key=config.nvidia_api_key,
+        base_url=config.llm_base_url,
+        model=config.llm_model,
+    )
+    for function_name, handler in bot.functions.items():
+        llm.register_function(function_name, handler)
+    logger.info(f"NVIDIA LLM ready ({config.llm_model})")
+
+    # ---- NVIDIA Riva TTS (Magpie Multilingual) -----------------------------
+    tts = CachedRivaTTSService(
+        api_key=config.nvidia_api_key,
+        server=config.tts_url,
+        voice_id=config.tts_voice_id,
+        model_function_map={
+            "function_id": config.tts_function_id,
+            "model_name": "magpie-tts-multilingual",
+        },
+        sample_rate=config.tts_sample_rate,
+    )
+    logger.info("Riva TTS ready (Magpie)")
+
+    # ---- FAQ answer cache ---------------------------------------------------
+    faq = FAQCache(bot.faqs, tts) if bot.faqs else None
+
+    # ---- LLM context -------------------------------------------------------
+    context = FixedPrefixLLMContext(list(_system_messages(bot.system_prompt)), tools=bot.tools)
+    context_aggregator = llm.create_context_aggregator(context)
+
+    # Open the Riva STT, LLM and Riva TTS connections, and load the FAQ
+    # embeddings, while Daily joins so the first turn doesn't pay for them.
+    # The welcome audio stays cached for the next rooms this bot process serves.
+    warmup = asyncio.gather(
+        stt.warmup(),
+        llm.warmup(context),
+        tts.warmup(bot.welcome_message),
+        *([faq.warmup()] if faq else []),
+    )
+
+    # ---- Pipeline -----------------------------------------------------------
+    pipeline = Pipeline([
+        transport.input(),
+        stt,
+        VADGatedTranscriptFilter(),
+        context_aggregator.user(),
+        *([faq] if faq else []),
+        llm,
+        CoalesceTextFrames(),
+        LLMTextProcessor(text_aggregator=ClauseTextAggregator()),
+        tts,
+        transport.output(),
+        context_aggregator.assistant(),
+    ])
+
+    task = PipelineTask(
+        pipeline,
+        params=PipelineParams(
+            # Match the Riva rates so audio isn't resampled on its way in or
+            # out; Daily Opus-encodes whatever rate it is handed.
+            audio_in_sample_rate=config.asr_sample_rate,
+            audio_out_sample_rate=config.tts_sample_rate,
+            allow_interruptions=True,
+            enable_metrics=True,
+            enable_usage_metrics=True,
+        ),
+    )
+
+    # ---- Event handlers -----------------------------------------------------
+    autogreet_task = greet_first_participant(transport, task, bot.welcome_message)
+
+    @transport.event_handler("on_participant_left")
+    async def on_participant_left(transport, participant, reason):
+        logger.opt(lazy=True).info(
+            "Participant left: {}, reason: {}", lambda: participant.get("id"), lambda: reason
+        )
+        autogreet_task.cancel()
+        await task.cancel()
+
+    # ---- Run ----------------------------------------------------------------
+    runner = PipelineRunner()
+    try:
+        await runner.run(task)
+    finally:
+        autogreet_task.cancel()
+        warmup.cancel()
+    logger.info("Bot pipeline finished")